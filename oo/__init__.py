@@ -15,10 +15,14 @@ Advanced usage with Client:
 
 from .client import (
     Client,
+    close_shared_session,
     get_secret,
+    get_secrets,
+    invalidate_cache,
     proxy,
     chat,
 )
+from .cache import SecretCache
 from .exceptions import (
     DoubleOError,
     SecretError,
@@ -33,8 +37,13 @@ __all__ = [
     "Client",
     # Convenience functions
     "get_secret",
+    "get_secrets",
     "proxy",
     "chat",
+    "close_shared_session",
+    "invalidate_cache",
+    # Caching
+    "SecretCache",
     # Exceptions
     "DoubleOError",
     "SecretError",
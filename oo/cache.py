@@ -0,0 +1,240 @@
+"""In-memory TTL cache for fetched secrets."""
+
+import copy
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type
+
+
+def _read_only(value: Any) -> Any:
+    """Wrap a dict in a read-only view of a copy, so readers can't alias it."""
+    if isinstance(value, dict):
+        return MappingProxyType(dict(value))
+    return value
+
+
+class _CachedError:
+    """Marks a cached failure, so it can be stored alongside plain values."""
+    
+    __slots__ = ("error",)
+    
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class SecretCache:
+    """
+    Thread-safe in-memory cache with a per-entry time-to-live.
+    
+    Lookups never take the lock: a dict read and an LRU reordering are each
+    atomic in CPython, so only writes are serialized. Concurrent misses for
+    the same key can be coalesced into a single fetch with get_or_fetch().
+    
+    Parsed objects can be cached without serializing them to strings. Dicts
+    are stored as a read-only view of a shallow copy, so one reader can't
+    change the value seen by the others; nested objects and other mutable
+    values are shared as-is and must not be modified. Failures can be cached
+    too (negative caching), in which case lookups re-raise the error until it
+    expires.
+    
+    Values and expiry times are kept in parallel dicts rather than per-entry
+    tuples. Expiry times are integer nanoseconds from the clock, so a
+    lookup is a single integer comparison. Expired entries are purged on
+    writes using a min-heap of expiry times, and the cache never holds more
+    than maxsize entries; when full, the least recently used entries are
+    evicted first.
+    
+    Args:
+        maxsize: Maximum number of cached entries (default: 10000)
+        clock: Function returning the current time in integer nanoseconds
+            (default: time.monotonic_ns)
+    """
+    
+    __slots__ = (
+        "_values",
+        "_expiries",
+        "_expiry_heap",
+        "_maxsize",
+        "_clock",
+        "_inflight",
+        "_lock",
+    )
+    
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        clock: Callable[[], int] = time.monotonic_ns
+    ):
+        self._values: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._expiries: Dict[Hashable, int] = {}
+        self._expiry_heap: List[Tuple[int, Hashable]] = []
+        self._maxsize = maxsize
+        self._clock = clock
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for a key.
+        
+        Args:
+            key: The cache key.
+            
+        Returns:
+            The cached value, or None if missing or expired.
+            
+        Raises:
+            A copy of the cached exception if the key holds a cached failure.
+        """
+        expiry = self._expiries.get(key)
+        if expiry is None or expiry <= self._clock():
+            return None
+        value = self._values.get(key)
+        try:
+            self._values.move_to_end(key)
+        except KeyError:
+            # Evicted by a concurrent write since the reads above
+            return None
+        if type(value) is _CachedError:
+            raise copy.copy(value.error)
+        return value
+    
+    def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Any],
+        ttl: float,
+        error_ttl: float = 0,
+        cache_errors: Tuple[Type[BaseException], ...] = ()
+    ) -> Any:
+        """
+        Return the cached value for a key, fetching it on a miss.
+        
+        Only one caller fetches a missing key; concurrent callers for the
+        same key wait for that result (or exception) instead of fetching
+        it again.
+        
+        Args:
+            key: The cache key.
+            fetch: Callable returning the value to cache.
+            ttl: Time-to-live in seconds.
+            error_ttl: Time-to-live in seconds for cached failures
+                (default: 0, failures are not cached).
+            cache_errors: Exception types raised by fetch to cache.
+            
+        Returns:
+            The cached or freshly fetched value.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        
+        with self._lock:
+            value = self.get(key)
+            if value is not None:
+                return value
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_owner:
+            return future.result()
+        
+        try:
+            value = _read_only(fetch())
+            self.set(key, value, ttl)
+        except BaseException as e:
+            if error_ttl and isinstance(e, cache_errors):
+                self.set_error(key, e, error_ttl)
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+    
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """
+        Store a value for a key.
+        
+        Args:
+            key: The cache key.
+            value: The value to cache. Dicts are copied and stored read-only.
+            ttl: Time-to-live in seconds.
+        """
+        self._store(key, _read_only(value), ttl)
+    
+    def set_error(self, key: Hashable, error: BaseException, ttl: float) -> None:
+        """
+        Store a failure for a key, so lookups raise it until it expires.
+        
+        Args:
+            key: The cache key.
+            error: The exception to raise on lookup.
+            ttl: Time-to-live in seconds.
+        """
+        self._store(key, _CachedError(error), ttl)
+    
+    def _store(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Write an entry and purge expired or excess entries."""
+        now = self._clock()
+        expiry = now + int(ttl * 1_000_000_000)
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            self._expiries[key] = expiry
+            heapq.heappush(self._expiry_heap, (expiry, key))
+            self._purge(now)
+    
+    def _purge(self, now: int) -> None:
+        """Drop expired entries, then the least recently used ones above maxsize."""
+        values = self._values
+        expiries = self._expiries
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            # Skip heap records left behind by re-inserted, invalidated or evicted keys
+            if expiries.get(key) == expiry:
+                del values[key]
+                del expiries[key]
+        
+        while len(values) > self._maxsize:
+            key, _ = values.popitem(last=False)
+            del expiries[key]
+        
+        # Keep stale records from piling up when keys are refreshed often
+        if len(heap) > 2 * len(expiries) + 64:
+            self._expiry_heap = [(expiry, key) for key, expiry in expiries.items()]
+            heapq.heapify(self._expiry_heap)
+    
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single key from the cache."""
+        with self._lock:
+            self._values.pop(key, None)
+            self._expiries.pop(key, None)
+    
+    def reset_after_fork(self) -> None:
+        """
+        Drop state owned by other threads after os.fork().
+        
+        The forked child only inherits the calling thread, so fetches in
+        flight in the parent never complete and a lock held by another
+        thread is never released. Cached entries are kept.
+        """
+        self._lock = threading.Lock()
+        self._inflight = {}
+    
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._values.clear()
+            self._expiries.clear()
+            self._expiry_heap.clear()
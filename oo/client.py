@@ -1,15 +1,254 @@
 """Double-O client module for secret fetching and proxy API calls."""
 
+import atexit
+import functools
 import json
-from typing import Any, Dict, Optional, Union
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 
-from .exceptions import AuthenticationError, ProxyError, SecretError
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import httpx
+    import h2  # noqa: F401 - needed by httpx for http2=True
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+from .cache import SecretCache
+from .exceptions import AuthenticationError, DoubleOError, ProxyError, SecretError
 
 
 BASE_URL = "https://double-o-539191849800.europe-west1.run.app"
 
+
+if orjson is not None:
+    # Hand datetimes and dataclasses to the json module, which rejects them,
+    # so the fast extra doesn't change which payloads can be sent
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize a request payload to JSON bytes."""
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # Payloads orjson rejects (e.g. integers over 64 bits) still
+            # serialize the same way as without the fast extra
+            return json.dumps(obj).encode()
+    
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize a request payload to JSON bytes."""
+        return json.dumps(obj).encode()
+    
+    _json_loads = json.loads
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+
+@functools.lru_cache(maxsize=1024)
+def _secret_url_for(secret_url: str, token: str) -> str:
+    """Build the secret URL with the token already encoded in the query."""
+    return f"{secret_url}?token={quote(token, safe='')}"
+
+
+@functools.lru_cache(maxsize=256)
+def _proxy_headers_for(token: str) -> Mapping[str, str]:
+    """Build the read-only default proxy headers for a token."""
+    return MappingProxyType({"Authorization": f"Bearer {token}", **_JSON_CONTENT_TYPE})
+
+
+# Supported HTTP transports and the keyword each uses for a raw request body
+_BODY_ARGS = {"requests": "data", "httpx": "content"}
+
+# Transport-level failures, wrapped into SecretError/ProxyError
+_REQUEST_EXCEPTIONS: Tuple[Type[Exception], ...] = (
+    requests.exceptions.RequestException,
+)
+
+# Transient failures that are worth retrying for idempotent requests
+_RETRYABLE_EXCEPTIONS: Tuple[Type[Exception], ...] = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+# Failures raised before a request was sent, so retrying cannot repeat it;
+# see _failed_before_sending() for refused connections over requests
+_CONNECT_EXCEPTIONS: Tuple[Type[Exception], ...] = (
+    requests.exceptions.ConnectTimeout,
+)
+
+if httpx is not None:
+    _REQUEST_EXCEPTIONS += (httpx.RequestError,)
+    _RETRYABLE_EXCEPTIONS += (httpx.NetworkError, httpx.TimeoutException)
+    _CONNECT_EXCEPTIONS += (httpx.ConnectError, httpx.ConnectTimeout)
+
+# Methods that are safe to resend after a read timeout or dropped connection
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed idempotent request is worth retrying."""
+    return isinstance(error, _RETRYABLE_EXCEPTIONS)
+
+
+def _failed_before_sending(error: Exception) -> bool:
+    """Whether a request failed before it was sent, so a retry can't repeat it."""
+    if isinstance(error, _CONNECT_EXCEPTIONS):
+        return True
+    # requests reports a refused connection as a ConnectionError wrapping
+    # urllib3's MaxRetryError, whose reason is a NewConnectionError
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        reason = getattr(error.args[0], "reason", None)
+        return isinstance(reason, NewConnectionError)
+    return False
+
+
+def _retry_with_backoff(
+    func: Callable[[], requests.Response],
+    retries: int,
+    backoff_factor: float,
+    max_backoff: float,
+    should_retry: Callable[[Exception], bool] = _is_transient
+) -> requests.Response:
+    """
+    Call func, retrying transient failures with exponential backoff.
+    
+    Uses "full jitter": each delay is drawn uniformly from zero up to the
+    capped exponential backoff, so concurrent clients spread their retries
+    out instead of hitting the server at the same moment.
+    """
+    if retries == 0:
+        return func()
+    for attempt in range(retries):
+        try:
+            return func()
+        except _RETRYABLE_EXCEPTIONS as e:
+            if not should_retry(e):
+                raise
+            delay = min(max_backoff, backoff_factor * (2 ** attempt))
+            time.sleep(random.uniform(0, delay))
+    return func()
+
+
+# Connections kept per host by the shared session; get_secrets() defaults to
+# this many workers so a batch never opens connections the pool would discard
+_POOL_MAXSIZE = 30
+
+# The shared sessions serve every Client, so they must not keep cookies set
+# for one caller's requests and send them on another's
+_REFUSE_COOKIES = DefaultCookiePolicy(allowed_domains=[])
+
+# Process-wide sessions so every Client reuses the same connection pool
+_SHARED_SESSION: Optional[requests.Session] = None
+_SHARED_HTTP2_CLIENT: Optional["httpx.Client"] = None
+_SHARED_LOCK = threading.Lock()
+
+
+def _get_shared_session() -> requests.Session:
+    """Get or create the shared session backing all Client instances."""
+    global _SHARED_SESSION
+    session = _SHARED_SESSION
+    if session is not None:
+        return session
+    with _SHARED_LOCK:
+        if _SHARED_SESSION is None:
+            session = requests.Session()
+            session.cookies.set_policy(_REFUSE_COOKIES)
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=_POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SHARED_SESSION = session
+        return _SHARED_SESSION
+
+
+def _get_shared_http2_client() -> "httpx.Client":
+    """Get or create the shared HTTP/2 client for the httpx transport."""
+    global _SHARED_HTTP2_CLIENT
+    client = _SHARED_HTTP2_CLIENT
+    if client is not None:
+        return client
+    with _SHARED_LOCK:
+        if _SHARED_HTTP2_CLIENT is None:
+            _SHARED_HTTP2_CLIENT = httpx.Client(
+                http2=True,
+                cookies=CookieJar(policy=_REFUSE_COOKIES),
+                # Match requests, which follows redirects by default
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20
+                )
+            )
+        return _SHARED_HTTP2_CLIENT
+
+
+def close_shared_session() -> None:
+    """
+    Close the shared sessions and their pooled connections.
+    
+    Intended for application shutdown hooks. A new session is created
+    lazily the next time a client sends a request.
+    """
+    global _SHARED_SESSION, _SHARED_HTTP2_CLIENT
+    with _SHARED_LOCK:
+        if _SHARED_SESSION is not None:
+            _SHARED_SESSION.close()
+            _SHARED_SESSION = None
+        if _SHARED_HTTP2_CLIENT is not None:
+            _SHARED_HTTP2_CLIENT.close()
+            _SHARED_HTTP2_CLIENT = None
+
+
+def _reset_shared_session_after_fork() -> None:
+    """Drop the sessions and cache state inherited from a parent after os.fork()."""
+    global _SHARED_SESSION, _SHARED_HTTP2_CLIENT, _SHARED_LOCK
+    _SHARED_SESSION = None
+    _SHARED_HTTP2_CLIENT = None
+    _SHARED_LOCK = threading.Lock()
+    _secret_cache.reset_after_fork()
+
+
+atexit.register(close_shared_session)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_shared_session_after_fork)
+
+
+# Secret cache shared by all Client instances, keyed by (secret URL, token)
+_secret_cache = SecretCache()
+
+
 class Client:
     """
     Double-O Client for interacting with secret management and proxy services.
@@ -17,23 +256,78 @@ class Client:
     Args:
         base_url: Base URL for the API server (default: BASE_URL)
         timeout: Request timeout in seconds (default: 30)
+        retries: Retries for connection errors and timeouts (default: 0).
+            Non-idempotent proxy calls such as POST are only retried when
+            the connection could not be established.
+        backoff_factor: Base delay in seconds between retries, doubled on
+            each attempt (default: 0.5)
+        max_backoff: Upper bound in seconds for a single retry delay
+            (default: 30)
+        negative_cache_ttl: Seconds to remember authentication failures
+            for cached lookups, 0 to disable (default: 5)
+        transport: HTTP library to use, "requests" or "httpx" for HTTP/2
+            multiplexing over a single connection (default: "requests")
     """
     
+    __slots__ = (
+        "base_url",
+        "timeout",
+        "retries",
+        "backoff_factor",
+        "max_backoff",
+        "negative_cache_ttl",
+        "transport",
+        "_secret_url",
+        "_proxy_prefix",
+    )
+    
+    _cache: ClassVar[SecretCache] = _secret_cache
+    
     def __init__(
         self,
         base_url: str = BASE_URL,
-        timeout: int = 30
+        timeout: int = 30,
+        retries: int = 0,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        negative_cache_ttl: float = 5.0,
+        transport: str = "requests"
     ):
+        if transport not in _BODY_ARGS:
+            raise ValueError(f"Unknown transport: {transport!r}")
+        if transport == "httpx" and httpx is None:
+            raise ImportError(
+                "The httpx transport requires the 'http2' extra: "
+                "pip install 'double-o[http2]'"
+            )
+        
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self._session = requests.Session()
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.negative_cache_ttl = negative_cache_ttl
+        self.transport = transport
+        self._secret_url = f"{self.base_url}/api/secret"
+        self._proxy_prefix = f"{self.base_url}/api/proxy/"
     
-    def get_secret(self, token: str) -> str:
+    @property
+    def _session(self) -> Any:
+        """The shared session, looked up per call so forks and resets are seen."""
+        if self.transport == "httpx":
+            return _get_shared_http2_client()
+        return _get_shared_session()
+    
+    def get_secret(self, token: str, cache_ttl: Optional[float] = None) -> str:
         """
         Fetch a secret value using a token.
         
         Args:
             token: The authentication token for fetching the secret.
+            cache_ttl: Seconds to cache the secret for (optional). While
+                cached, the secret is returned without contacting the server,
+                and concurrent lookups of an uncached token share one request.
+                Authentication failures are cached for negative_cache_ttl.
             
         Returns:
             The secret value as a string.
@@ -42,16 +336,85 @@ class Client:
             SecretError: If the secret cannot be retrieved.
             AuthenticationError: If the token is invalid.
         """
-        url = f"{self.base_url}/api/secret"
+        if cache_ttl:
+            return cast(str, self._cache.get_or_fetch(
+                (self._secret_url, token),
+                lambda: self._fetch_secret(token),
+                cache_ttl,
+                error_ttl=self.negative_cache_ttl,
+                cache_errors=(AuthenticationError,)
+            ))
+        return self._fetch_secret(token)
+    
+    def get_secrets(
+        self,
+        tokens: List[str],
+        cache_ttl: Optional[float] = None,
+        concurrency: int = _POOL_MAXSIZE
+    ) -> Dict[str, Union[str, DoubleOError]]:
+        """
+        Fetch several secrets concurrently.
+        
+        Cached secrets are returned directly; the rest are fetched in
+        parallel over the shared connection pool.
+        
+        Args:
+            tokens: The authentication tokens for fetching the secrets.
+            cache_ttl: Seconds to cache each secret for (optional).
+            concurrency: Maximum number of requests in flight (default: 30,
+                the size of the shared connection pool).
+            
+        Returns:
+            A dictionary mapping each token to its secret value, or to the
+            DoubleOError raised while fetching it.
+            
+        Raises:
+            ValueError: If concurrency is less than 1.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        
+        results: Dict[str, Union[str, DoubleOError]] = {}
+        pending = []
+        for token in dict.fromkeys(tokens):
+            try:
+                cached = (
+                    self._cache.get((self._secret_url, token)) if cache_ttl else None
+                )
+            except DoubleOError as e:
+                cached = e
+            if cached is not None:
+                results[token] = cached
+            else:
+                pending.append(token)
         
+        if not pending:
+            return results
+        
+        def fetch(token: str) -> Union[str, DoubleOError]:
+            try:
+                return self.get_secret(token, cache_ttl)
+            except DoubleOError as e:
+                return e
+        
+        workers = min(concurrency, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results.update(zip(pending, executor.map(fetch, pending)))
+        return results
+    
+    def _fetch_secret(self, token: str) -> str:
+        """Fetch a secret from the server, bypassing the cache."""
         try:
-            response = self._session.get(
-                url,
-                params={"token": token},
+            response = self._request_with_retry(
+                self._session.get,
+                _secret_url_for(self._secret_url, token),
                 timeout=self.timeout
             )
-            response.raise_for_status()
-            data = response.json()
+            if response.status_code >= 400:
+                if response.status_code == 401:
+                    raise AuthenticationError("Invalid token")
+                raise SecretError(f"HTTP error: {response.status_code}")
+            data = _json_loads(response.content)
             
             if "value" in data:
                 return data["value"]
@@ -63,12 +426,10 @@ class Client:
             else:
                 raise SecretError("Unknown error: no value returned")
                 
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 401:
-                raise AuthenticationError("Invalid token") from e
-            raise SecretError(f"HTTP error: {e}") from e
-        except requests.exceptions.RequestException as e:
+        except _REQUEST_EXCEPTIONS as e:
             raise SecretError(f"Request failed: {e}") from e
+        except ValueError as e:
+            raise SecretError(f"Invalid JSON response: {e}") from e
     
     def proxy(
         self,
@@ -95,32 +456,41 @@ class Client:
             ProxyError: If the proxy request fails.
             AuthenticationError: If the token is invalid.
         """
-        url = f"{self.base_url}/api/proxy/{path.lstrip('/')}"
+        url = self._proxy_prefix + path.lstrip("/")
         
-        request_headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
+        request_headers = _proxy_headers_for(token)
         if headers:
-            request_headers.update(headers)
+            request_headers = {**request_headers, **headers}
+        
+        body = _json_dumps(payload) if payload is not None else None
+        
+        method = method.upper()
+        if method in _IDEMPOTENT_METHODS:
+            should_retry = _is_transient
+        else:
+            # The upstream may already have handled a request that timed out
+            should_retry = _failed_before_sending
         
         try:
-            response = self._session.request(
-                method=method.upper(),
+            response = self._request_with_retry(
+                self._session.request,
+                should_retry=should_retry,
+                method=method,
                 url=url,
                 headers=request_headers,
-                data=json.dumps(payload) if payload else None,
-                timeout=self.timeout
+                timeout=self.timeout,
+                **{_BODY_ARGS[self.transport]: body}
             )
-            response.raise_for_status()
-            return response.json()
+            if response.status_code >= 400:
+                if response.status_code == 401:
+                    raise AuthenticationError("Invalid proxy token")
+                raise ProxyError(f"Proxy request failed: {response.status_code}")
+            return _json_loads(response.content)
             
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 401:
-                raise AuthenticationError("Invalid proxy token") from e
-            raise ProxyError(f"Proxy request failed: {e}") from e
-        except requests.exceptions.RequestException as e:
+        except _REQUEST_EXCEPTIONS as e:
             raise ProxyError(f"Request failed: {e}") from e
+        except ValueError as e:
+            raise ProxyError(f"Invalid JSON response: {e}") from e
     
     def chat_completion(
         self,
@@ -148,9 +518,45 @@ class Client:
         }
         return self.proxy("v1/chat/completions", token, payload=payload)
     
+    def _request_with_retry(
+        self,
+        send: Callable[..., requests.Response],
+        *args: Any,
+        should_retry: Callable[[Exception], bool] = _is_transient,
+        **kwargs: Any
+    ) -> requests.Response:
+        """Send a request, retrying transient failures per the client settings."""
+        return _retry_with_backoff(
+            functools.partial(send, *args, **kwargs),
+            self.retries,
+            self.backoff_factor,
+            self.max_backoff,
+            should_retry
+        )
+    
+    def invalidate_cache(self, token: Optional[str] = None) -> None:
+        """
+        Drop cached secrets.
+        
+        The cache is shared by all clients, so calling this without a token
+        also drops the secrets cached by clients for other servers.
+        
+        Args:
+            token: The token whose secret to drop from this client's server
+                (default: all secrets of all clients).
+        """
+        if token is None:
+            self._cache.clear()
+        else:
+            self._cache.invalidate((self._secret_url, token))
+    
     def close(self):
-        """Close the underlying session."""
-        self._session.close()
+        """
+        Release the client.
+        
+        The connection pool is shared with other clients and stays open;
+        use close_shared_session() to shut it down.
+        """
     
     def __enter__(self):
         return self
@@ -159,19 +565,23 @@ class Client:
         self.close()
 
 
-# Default client instance for simple usage
-_default_client: Optional[Client] = None
+# Default client instances for simple usage, one per base URL
+_default_clients: Dict[str, Client] = {}
 
 
 def _get_default_client(base_url: str = BASE_URL) -> Client:
-    """Get or create the default client instance."""
-    global _default_client
-    if _default_client is None:
-        _default_client = Client(base_url=base_url)
-    return _default_client
+    """Get or create the default client instance for a base URL."""
+    client = _default_clients.get(base_url)
+    if client is None:
+        client = _default_clients.setdefault(base_url, Client(base_url=base_url))
+    return client
 
 
-def get_secret(token: str, base_url: str = BASE_URL) -> str:
+def get_secret(
+    token: str,
+    base_url: str = BASE_URL,
+    cache_ttl: Optional[float] = None
+) -> str:
     """
     Fetch a secret value using a token.
     
@@ -180,6 +590,7 @@ def get_secret(token: str, base_url: str = BASE_URL) -> str:
     Args:
         token: The authentication token for fetching the secret.
         base_url: Base URL for the API server (default: BASE_URL)
+        cache_ttl: Seconds to cache the secret for (optional).
         
     Returns:
         The secret value as a string.
@@ -190,7 +601,50 @@ def get_secret(token: str, base_url: str = BASE_URL) -> str:
         >>> print(secret)
     """
     client = _get_default_client(base_url)
-    return client.get_secret(token)
+    return client.get_secret(token, cache_ttl)
+
+
+def get_secrets(
+    tokens: List[str],
+    base_url: str = BASE_URL,
+    cache_ttl: Optional[float] = None,
+    concurrency: int = _POOL_MAXSIZE
+) -> Dict[str, Union[str, DoubleOError]]:
+    """
+    Fetch several secrets concurrently.
+    
+    This is a convenience function that uses a default client instance.
+    
+    Args:
+        tokens: The authentication tokens for fetching the secrets.
+        base_url: Base URL for the API server (default: BASE_URL)
+        cache_ttl: Seconds to cache each secret for (optional).
+        concurrency: Maximum number of requests in flight (default: 30).
+        
+    Returns:
+        A dictionary mapping each token to its secret value, or to the
+        DoubleOError raised while fetching it.
+        
+    Example:
+        >>> import oo
+        >>> secrets = oo.get_secrets(["TOKEN_A", "TOKEN_B"])
+        >>> print(secrets["TOKEN_A"])
+    """
+    client = _get_default_client(base_url)
+    return client.get_secrets(tokens, cache_ttl, concurrency)
+
+
+def invalidate_cache(token: Optional[str] = None, base_url: str = BASE_URL) -> None:
+    """
+    Drop cached secrets.
+    
+    Args:
+        token: The token whose secret to drop (default: all secrets of all
+            servers).
+        base_url: Base URL of the server the token belongs to
+            (default: BASE_URL)
+    """
+    _get_default_client(base_url).invalidate_cache(token)
 
 
 def proxy(
@@ -0,0 +1,72 @@
+"""Shared pytest fixtures for the Double-O tests."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import oo
+from oo import Client
+
+
+@pytest.fixture
+def client():
+    """A client pointed at a local test server."""
+    client = Client(base_url="http://localhost:3001")
+    yield client
+    client.close()
+
+
+@pytest.fixture(autouse=True)
+def _clear_secret_cache():
+    """Keep cached secrets from leaking between tests."""
+    oo.invalidate_cache()
+    yield
+    oo.invalidate_cache()
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """Sets a session cookie and echoes back the cookie it was sent."""
+    
+    def do_GET(self):
+        self._respond()
+    
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._respond()
+    
+    def _respond(self):
+        # Paths under /old/ permanently moved one level up
+        if self.path.startswith("/old/"):
+            self.send_response(307)
+            self.send_header("Location", self.path[len("/old"):])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({
+            "value": "live_secret",
+            "cookie": self.headers.get("Cookie"),
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "sess=userA; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def live_server():
+    """Base URL of a real local HTTP server, for behavior mocks can't show."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
@@ -1,141 +1,717 @@
 """Tests for the Double-O client module."""
 
+import dataclasses
+import datetime
 import json
+import threading
+import time
+import types
 import unittest
-from unittest.mock import Mock, patch
+from concurrent.futures import Future
+from unittest.mock import call, patch
+
+import pytest
+import requests
+from requests_mock import Mocker
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+try:
+    import httpx
+    import h2  # noqa: F401
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import oo
-from oo import Client, SecretError, ProxyError, AuthenticationError
+from oo import Client, SecretCache, SecretError, ProxyError, AuthenticationError
+
+
+LOCAL_URL = "http://localhost:3001"
+SECRET_URL = f"{LOCAL_URL}/api/secret"
+PROXY_TEST_URL = f"{LOCAL_URL}/api/proxy/v1/test"
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+def fake_response(payload=None, status_code=200):
+    """Build a lightweight stand-in for an httpx response."""
+    content = oo.client._json_dumps(payload) if payload is not None else b""
+    return types.SimpleNamespace(status_code=status_code, content=content)
+
+
+class FakeTransport:
+    """Records requests and returns a canned response or raises an error."""
+    
+    def __init__(self):
+        self.calls = 0
+        self.kwargs = None
+        self.response = None
+        self.error = None
+    
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        self.kwargs = kwargs
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+def test_get_secret_success(client, requests_mock):
+    """Test successful secret retrieval."""
+    requests_mock.get(SECRET_URL, json={"value": "my_secret_value"})
+    
+    result = client.get_secret("test_token")
+    
+    assert result == "my_secret_value"
+    assert requests_mock.call_count == 1
+    assert requests_mock.last_request.url == f"{SECRET_URL}?token=test_token"
+
+
+def test_get_secret_error(client, requests_mock):
+    """Test secret retrieval with error response."""
+    requests_mock.get(SECRET_URL, json={"error": "Invalid token"})
+    
+    with pytest.raises(AuthenticationError):
+        client.get_secret("invalid_token")
+
+
+def test_get_secret_unauthorized(client, requests_mock):
+    """Test that a 401 response raises AuthenticationError."""
+    requests_mock.get(SECRET_URL, status_code=401)
+    
+    with pytest.raises(AuthenticationError):
+        client.get_secret("invalid_token")
 
 
-class TestClient(unittest.TestCase):
-    """Test cases for the Client class."""
+def test_proxy_server_error(client, requests_mock):
+    """Test that a 5xx response raises ProxyError."""
+    requests_mock.post(f"{LOCAL_URL}/api/proxy/v1/test", status_code=502)
+    
+    with pytest.raises(ProxyError):
+        client.proxy("v1/test", "test_token", payload={})
+
+
+def test_proxy_success(client, requests_mock):
+    """Test successful proxy request."""
+    requests_mock.post(
+        f"{LOCAL_URL}/api/proxy/v1/chat/completions",
+        json={"choices": [{"message": {"content": "Hello!"}}]}
+    )
+    
+    result = client.proxy(
+        "v1/chat/completions",
+        "test_token",
+        payload={"model": "gpt-4o-mini", "messages": []}
+    )
+    
+    assert "choices" in result
+    assert requests_mock.call_count == 1
+    assert requests_mock.last_request.json() == {"model": "gpt-4o-mini", "messages": []}
+
+
+@pytest.mark.parametrize("payload", [
+    {"at": datetime.datetime(2024, 1, 1)},
+    {"point": Point(1, 2)},
+], ids=["datetime", "dataclass"])
+def test_proxy_rejects_payload_json_rejects(client, payload):
+    """Test that orjson-only types are rejected like without the fast extra."""
+    with pytest.raises(TypeError):
+        client.proxy("v1/test", "test_token", payload=payload)
+
+
+@pytest.mark.parametrize("payload,expected", [
+    ({1: "a"}, {"1": "a"}),
+    ({"big": 2 ** 70}, {"big": 2 ** 70}),
+], ids=["non_str_keys", "big_int"])
+def test_proxy_payload_matches_stdlib_json(client, requests_mock, payload, expected):
+    """Test that payloads accepted by the json module are sent unchanged."""
+    requests_mock.post(f"{LOCAL_URL}/api/proxy/v1/test", json={"result": "success"})
+    
+    client.proxy("v1/test", "test_token", payload=payload)
+    
+    assert requests_mock.last_request.json() == expected
+
+
+def test_proxy_extra_headers(client, requests_mock):
+    """Test that extra headers are merged over the defaults."""
+    requests_mock.post(f"{LOCAL_URL}/api/proxy/v1/test", json={"result": "success"})
+    
+    client.proxy(
+        "v1/test",
+        "test_token",
+        payload={},
+        headers={"X-Trace": "abc"}
+    )
+    client.proxy("v1/test", "test_token", payload={})
+    
+    first, second = (r.headers for r in requests_mock.request_history)
+    assert first["Authorization"] == "Bearer test_token"
+    assert first["Content-Type"] == "application/json"
+    assert first["X-Trace"] == "abc"
+    assert "X-Trace" not in second
+
+
+def test_chat_completion(client, requests_mock):
+    """Test chat completion convenience method."""
+    requests_mock.post(
+        f"{LOCAL_URL}/api/proxy/v1/chat/completions",
+        json={"choices": [{"message": {"content": "Hi there!"}}]}
+    )
+    
+    result = client.chat_completion(
+        "test_token",
+        messages=[{"role": "user", "content": "Hello!"}]
+    )
+    
+    assert "choices" in result
+
+
+@pytest.mark.skipif(orjson is None, reason="orjson not installed")
+def test_json_decoded_with_orjson(client, requests_mock):
+    """Test that responses are decoded with orjson when it is available."""
+    payload = {"choices": [{"message": {"content": "Grüße, 世界!"}}]}
+    requests_mock.post(
+        f"{LOCAL_URL}/api/proxy/v1/chat/completions",
+        content=orjson.dumps(payload)
+    )
+    
+    with patch("oo.client._json_loads", wraps=orjson.loads) as mock_loads:
+        result = client.chat_completion("test_token", messages=[])
+    
+    assert mock_loads.call_count == 1
+    assert result == payload
+
+
+def test_clients_share_session(client):
+    """Test that clients reuse the shared connection pool."""
+    other = Client(base_url="http://localhost:3001")
+    other.close()
+    
+    assert other._session is client._session
+
+
+def test_pool_configured(client):
+    """Test that the shared pool holds as many connections as get_secrets uses."""
+    for url in (LOCAL_URL, oo.client.BASE_URL):
+        adapter = client._session.get_adapter(url)
+        
+        assert adapter._pool_connections >= 10
+        assert adapter._pool_maxsize == oo.client._POOL_MAXSIZE
+
+
+TRANSPORTS = [
+    "requests",
+    pytest.param(
+        "httpx",
+        marks=pytest.mark.skipif(httpx is None, reason="httpx not installed")
+    ),
+]
+
+
+@pytest.mark.parametrize("transport", TRANSPORTS)
+def test_cookies_not_shared_between_clients(live_server, transport):
+    """Test that a cookie set for one client's request isn't sent by another."""
+    Client(base_url=live_server, transport=transport).proxy("v1/test", "token_a")
+    
+    other = Client(base_url=live_server, transport=transport)
+    result = other.proxy("v1/test", "token_b")
+    
+    assert result["cookie"] is None
+
+
+@pytest.mark.parametrize("transport", TRANSPORTS)
+def test_redirects_followed(live_server, transport):
+    """Test that both transports follow redirects from the server."""
+    client = Client(base_url=f"{live_server}/old", transport=transport)
+    
+    assert client.get_secret("test_token") == "live_secret"
+
+
+def test_close_shared_session(client):
+    """Test that a new session is created after the shared one is closed."""
+    old_session = client._session
+    
+    oo.close_shared_session()
+    
+    assert client._session is not old_session
+
+
+def test_session_reset_after_fork(client):
+    """Test that a forked child does not reuse the parent's session."""
+    old_session = client._session
+    
+    oo.client._reset_shared_session_after_fork()
+    
+    assert client._session is not old_session
+    old_session.close()
+
+
+def test_secret_cache_reset_after_fork(client, requests_mock):
+    """Test that fetches in flight in the parent don't block a forked child."""
+    requests_mock.get(SECRET_URL, json={"value": "child_secret"})
+    cache = oo.client._secret_cache
+    cache._inflight[(SECRET_URL, "test_token")] = Future()
+    cache._lock.acquire()
+    
+    oo.client._reset_shared_session_after_fork()
+    
+    assert client.get_secret("test_token", cache_ttl=60) == "child_secret"
+    assert requests_mock.call_count == 1
+
+
+@pytest.mark.parametrize("method,path,payload,func,args,expected", [
+    ("GET", "api/secret", {"value": "secret123"},
+     oo.get_secret, ("my_token",), "secret123"),
+    ("POST", "api/proxy/v1/test", {"result": "success"},
+     oo.proxy, ("v1/test", "my_token"), {"result": "success"}),
+    ("POST", "api/proxy/v1/chat/completions", {"choices": []},
+     oo.chat, ("my_token", [{"role": "user", "content": "Test"}]), {"choices": []}),
+], ids=["get_secret", "proxy", "chat"])
+def test_convenience_function(requests_mock, method, path, payload, func, args,
+                              expected):
+    """Test the module-level convenience functions."""
+    requests_mock.request(method, f"{oo.client.BASE_URL}/{path}", json=payload)
+    
+    result = func(*args)
+    
+    assert result == expected
+    assert requests_mock.call_count == 1
+
+
+class TestSecretCache(unittest.TestCase):
+    """Test cases for the SecretCache class."""
     
     def setUp(self):
         """Set up test fixtures."""
-        self.client = Client(base_url="http://localhost:3001")
+        self.cache = SecretCache()
+    
+    def test_cache_set_and_get(self):
+        """Test storing and reading a value."""
+        self.cache.set("key1", "value1", ttl=60)
+        
+        assert self.cache.get("key1") == "value1"
+        assert self.cache.get("missing") is None
     
-    def tearDown(self):
-        """Clean up after tests."""
-        self.client.close()
+    def test_cache_expiry(self):
+        """Test that entries expire after their TTL."""
+        now = [1_000_000_000_000]
+        cache = SecretCache(clock=lambda: now[0])
+        cache.set("key1", "value1", ttl=0.1)
+        assert cache.get("key1") == "value1"
+        
+        now[0] += 150_000_000
+        
+        assert cache.get("key1") is None
     
-    @patch('oo.client.requests.Session.get')
-    def test_get_secret_success(self, mock_get):
-        """Test successful secret retrieval."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"value": "my_secret_value"}
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+    def test_cached_dict_is_read_only(self):
+        """Test that a cached dict can't be changed by the writer or readers."""
+        env = {"API_KEY": "secret"}
+        self.cache.set("env", env, ttl=60)
+        env["API_KEY"] = "changed"
         
-        result = self.client.get_secret("test_token")
+        cached = self.cache.get("env")
         
-        self.assertEqual(result, "my_secret_value")
-        mock_get.assert_called_once()
-    
-    @patch('oo.client.requests.Session.get')
-    def test_get_secret_error(self, mock_get):
-        """Test secret retrieval with error response."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"error": "Invalid token"}
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-        
-        with self.assertRaises(AuthenticationError):
-            self.client.get_secret("invalid_token")
-    
-    @patch('oo.client.requests.Session.request')
-    def test_proxy_success(self, mock_request):
-        """Test successful proxy request."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"choices": [{"message": {"content": "Hello!"}}]}
-        mock_response.raise_for_status = Mock()
-        mock_request.return_value = mock_response
-        
-        result = self.client.proxy(
-            "v1/chat/completions",
-            "test_token",
-            payload={"model": "gpt-4o-mini", "messages": []}
-        )
+        assert cached == {"API_KEY": "secret"}
+        with pytest.raises(TypeError):
+            cached["API_KEY"] = "changed"
+    
+    def test_cache_error(self):
+        """Test that a cached failure is re-raised until it expires."""
+        self.cache.set_error("key1", AuthenticationError("Invalid token"), ttl=60)
         
-        self.assertIn("choices", result)
-        mock_request.assert_called_once()
-    
-    @patch('oo.client.requests.Session.request')
-    def test_chat_completion(self, mock_request):
-        """Test chat completion convenience method."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "Hi there!"}}]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_request.return_value = mock_response
-        
-        result = self.client.chat_completion(
-            "test_token",
-            messages=[{"role": "user", "content": "Hello!"}]
-        )
+        with pytest.raises(AuthenticationError):
+            self.cache.get("key1")
+    
+    def test_expired_entries_purged_on_write(self):
+        """Test that expired entries are dropped without being read."""
+        self.cache.set("key1", "value1", ttl=0)
+        self.cache.set("key2", "value2", ttl=60)
+        
+        assert "key1" not in self.cache._values
+        assert "key1" not in self.cache._expiries
+        assert self.cache.get("key2") == "value2"
+    
+    def test_refreshed_entry_survives_stale_expiry(self):
+        """Test that an old heap record does not evict a refreshed entry."""
+        now = [0]
+        cache = SecretCache(clock=lambda: now[0])
+        cache.set("key1", "old", ttl=1)
+        cache.set("key1", "new", ttl=60)
+        
+        now[0] += 2_000_000_000
+        cache.set("key2", "value2", ttl=60)
         
-        self.assertIn("choices", result)
+        assert cache.get("key1") == "new"
+        assert len(cache._expiry_heap) == 2
+    
+    def test_cache_maxsize(self):
+        """Test that the least recently used entries are evicted when full."""
+        cache = SecretCache(maxsize=2)
+        cache.set("key1", "value1", ttl=60)
+        cache.set("key2", "value2", ttl=60)
+        cache.get("key1")
+        cache.set("key3", "value3", ttl=60)
+        
+        assert cache.get("key1") == "value1"
+        assert cache.get("key2") is None
+        assert cache.get("key3") == "value3"
+    
+    def test_cache_invalidate(self):
+        """Test removing a single entry."""
+        self.cache.set("key1", "value1", ttl=60)
+        self.cache.set("key2", "value2", ttl=60)
+        
+        self.cache.invalidate("key1")
+        
+        assert self.cache.get("key1") is None
+        assert self.cache.get("key2") == "value2"
+    
+    def test_cache_clear(self):
+        """Test removing all entries."""
+        self.cache.set("key1", "value1", ttl=60)
+        self.cache.set("key2", "value2", ttl=60)
+        
+        self.cache.clear()
+        
+        assert self.cache.get("key1") is None
+        assert self.cache.get("key2") is None
+
+
+def test_cached_secret_fetched_once(client, requests_mock):
+    """Test that a cached secret is only fetched once."""
+    requests_mock.get(SECRET_URL, json={"value": "cached_secret"})
+    
+    first = client.get_secret("test_token", cache_ttl=60)
+    second = client.get_secret("test_token", cache_ttl=60)
+    
+    assert first == "cached_secret"
+    assert second == "cached_secret"
+    assert requests_mock.call_count == 1
+
+
+def test_no_caching_by_default(client, requests_mock):
+    """Test that secrets are fetched every time without cache_ttl."""
+    requests_mock.get(SECRET_URL, json={"value": "fresh_secret"})
+    
+    client.get_secret("test_token")
+    client.get_secret("test_token")
+    
+    assert requests_mock.call_count == 2
+
+
+def test_concurrent_misses_fetch_once(client, requests_mock):
+    """Test that concurrent lookups of an uncached token share one fetch."""
+    def slow_secret(request, context):
+        time.sleep(0.05)
+        return {"value": "shared_secret"}
+    
+    requests_mock.get(SECRET_URL, json=slow_secret)
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                client.get_secret("test_token", cache_ttl=60)
+            )
+        )
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert results == ["shared_secret"] * 10
+    assert requests_mock.call_count == 1
+
+
+def test_get_secrets(client, requests_mock):
+    """Test fetching several secrets in one call."""
+    def secret_for(request, context):
+        token = request.qs["token"][0]
+        if token == "bad_token":
+            return {"error": "Invalid token"}
+        return {"value": f"secret_for_{token}"}
+    
+    requests_mock.get(SECRET_URL, json=secret_for)
+    client._cache.set((SECRET_URL, "cached_token"), "cached_secret", 60)
+    
+    results = client.get_secrets(
+        ["token_a", "token_b", "bad_token", "cached_token"],
+        cache_ttl=60
+    )
+    
+    assert results["token_a"] == "secret_for_token_a"
+    assert results["token_b"] == "secret_for_token_b"
+    assert results["cached_token"] == "cached_secret"
+    assert isinstance(results["bad_token"], AuthenticationError)
+    assert requests_mock.call_count == 3
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+def test_get_secrets_invalid_concurrency(client, concurrency):
+    """Test that a non-positive concurrency is rejected up front."""
+    with pytest.raises(ValueError, match="concurrency"):
+        client.get_secrets(["token_a"], concurrency=concurrency)
+
+
+def test_auth_failure_negatively_cached(client, requests_mock):
+    """Test that an invalid token is not re-sent while negatively cached."""
+    requests_mock.get(SECRET_URL, status_code=401)
+    
+    for _ in range(3):
+        with pytest.raises(AuthenticationError):
+            client.get_secret("bad_token", cache_ttl=60)
+    
+    assert requests_mock.call_count == 1
 
 
-class TestConvenienceFunctions(unittest.TestCase):
-    """Test cases for module-level convenience functions."""
+def test_negative_cache_disabled(requests_mock):
+    """Test that negative_cache_ttl=0 disables negative caching."""
+    requests_mock.get(SECRET_URL, status_code=401)
+    client = Client(base_url=LOCAL_URL, negative_cache_ttl=0)
     
-    @patch('oo.client.requests.Session.get')
-    def test_get_secret_function(self, mock_get):
-        """Test the get_secret convenience function."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"value": "secret123"}
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+    for _ in range(2):
+        with pytest.raises(AuthenticationError):
+            client.get_secret("bad_token", cache_ttl=60)
+    
+    assert requests_mock.call_count == 2
+
+
+def test_invalidate_cache(client, requests_mock):
+    """Test that invalidating the cache forces a new fetch."""
+    requests_mock.get(SECRET_URL, json={"value": "cached_secret"})
+    
+    client.get_secret("test_token", cache_ttl=60)
+    oo.invalidate_cache("test_token", base_url=LOCAL_URL)
+    client.get_secret("test_token", cache_ttl=60)
+    
+    assert requests_mock.call_count == 2
+
+
+def test_convenience_functions_respect_base_url(requests_mock):
+    """Test that base_url selects the server for cached module-level lookups."""
+    requests_mock.get(f"{oo.client.BASE_URL}/api/secret", json={"value": "default"})
+    requests_mock.get("http://other/api/secret", json={"value": "other"})
+    
+    assert oo.get_secret("t") == "default"
+    assert oo.get_secret("t", base_url="http://other", cache_ttl=60) == "other"
+    oo.invalidate_cache("t", base_url="http://other")
+    oo.get_secret("t", base_url="http://other", cache_ttl=60)
+    
+    assert requests_mock.call_count == 3
+
+
+def test_cache_separated_by_server(requests_mock):
+    """Test that clients for different servers don't share cached secrets."""
+    requests_mock.get("http://prod/api/secret", json={"value": "PROD"})
+    requests_mock.get("http://staging/api/secret", json={"value": "STAGING"})
+    
+    prod = Client(base_url="http://prod").get_secret("t", cache_ttl=60)
+    staging = Client(base_url="http://staging").get_secret("t", cache_ttl=60)
+    
+    assert (prod, staging) == ("PROD", "STAGING")
+    assert requests_mock.call_count == 2
+
+
+class TestRetryLogic(unittest.TestCase):
+    """Test cases for retrying transient failures."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up a retrying client shared by all tests in the class."""
+        cls.client = Client(
+            base_url="http://localhost:3001",
+            retries=2,
+            backoff_factor=0.1
+        )
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared client."""
+        cls.client.close()
+    
+    def setUp(self):
+        """Mock the HTTP adapter and backoff sleeps for each test."""
+        self.mocker = Mocker()
+        self.mocker.start()
+        self.addCleanup(self.mocker.stop)
         
-        result = oo.get_secret("my_token")
+        sleep_patcher = patch('oo.client.time.sleep')
+        self.mock_sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
         
-        self.assertEqual(result, "secret123")
+        # Always jitter to the upper bound so the backoff schedule is exact
+        jitter_patcher = patch('oo.client.random.uniform', side_effect=lambda a, b: b)
+        jitter_patcher.start()
+        self.addCleanup(jitter_patcher.stop)
     
-    @patch('oo.client.requests.Session.request')
-    def test_proxy_function(self, mock_request):
-        """Test the proxy convenience function."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"result": "success"}
-        mock_response.raise_for_status = Mock()
-        mock_request.return_value = mock_response
+    def test_retry_on_transient_failure(self):
+        """Test that connection errors are retried until success."""
+        self.mocker.get(SECRET_URL, [
+            {"exc": requests.exceptions.ConnectionError},
+            {"exc": requests.exceptions.ConnectionError},
+            {"json": {"value": "secret"}},
+        ])
         
-        result = oo.proxy(
-            "v1/test",
-            "my_token",
-            payload={"data": "test"}
+        result = self.client.get_secret("test_token")
+        
+        assert result == "secret"
+        assert self.mocker.call_count == 3
+        assert self.mock_sleep.call_args_list == [call(0.1), call(0.2)]
+    
+    def test_retry_exhausted(self):
+        """Test that an error is raised once retries are exhausted."""
+        self.mocker.get(SECRET_URL, exc=requests.exceptions.ConnectionError)
+        
+        with pytest.raises(SecretError):
+            self.client.get_secret("test_token")
+        
+        assert self.mocker.call_count == 3
+        assert self.mock_sleep.call_count == 2
+    
+    def test_no_retry_when_disabled(self):
+        """Test that requests are not retried by default."""
+        self.mocker.get(SECRET_URL, exc=requests.exceptions.ConnectionError)
+        client = Client(base_url="http://localhost:3001")
+        
+        with pytest.raises(SecretError):
+            client.get_secret("test_token")
+        
+        assert self.mocker.call_count == 1
+        assert self.mock_sleep.call_count == 0
+    
+    def test_post_not_retried_after_read_timeout(self):
+        """Test that a POST that may have reached the server is not resent."""
+        self.mocker.post(PROXY_TEST_URL, exc=requests.exceptions.ReadTimeout)
+        
+        with pytest.raises(ProxyError):
+            self.client.proxy("v1/test", "test_token", payload={"data": "test"})
+        
+        assert self.mocker.call_count == 1
+    
+    def test_post_retried_after_connect_timeout(self):
+        """Test that a POST is retried when the connection never opened."""
+        self.mocker.post(PROXY_TEST_URL, [
+            {"exc": requests.exceptions.ConnectTimeout},
+            {"json": {"result": "success"}},
+        ])
+        
+        result = self.client.proxy("v1/test", "test_token", payload={"data": "test"})
+        
+        assert result == {"result": "success"}
+        assert self.mocker.call_count == 2
+    
+    def test_post_retried_after_refused_connection(self):
+        """Test that a POST is retried when the server refused the connection."""
+        refused = MaxRetryError(
+            None, PROXY_TEST_URL, NewConnectionError(None, "refused")
         )
+        self.mocker.post(PROXY_TEST_URL, [
+            {"exc": requests.exceptions.ConnectionError(refused)},
+            {"json": {"result": "success"}},
+        ])
         
-        self.assertEqual(result["result"], "success")
-    
-    @patch('oo.client.requests.Session.request')
-    def test_chat_function(self, mock_request):
-        """Test the chat convenience function."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "Response"}}]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_request.return_value = mock_response
-        
-        result = oo.chat(
-            "my_token",
-            messages=[{"role": "user", "content": "Test"}]
+        result = self.client.proxy("v1/test", "test_token", payload={"data": "test"})
+        
+        assert result == {"result": "success"}
+        assert self.mocker.call_count == 2
+    
+    def test_post_not_retried_after_dropped_connection(self):
+        """Test that a POST is not resent when the connection drops mid-request."""
+        dropped = ProtocolError("Connection aborted.", ConnectionResetError())
+        self.mocker.post(
+            PROXY_TEST_URL,
+            exc=requests.exceptions.ConnectionError(dropped)
         )
         
-        self.assertIn("choices", result)
+        with pytest.raises(ProxyError):
+            self.client.proxy("v1/test", "test_token", payload={"data": "test"})
+        
+        assert self.mocker.call_count == 1
+    
+    def test_backoff_capped(self):
+        """Test that retry delays never exceed max_backoff."""
+        self.mocker.get(SECRET_URL, exc=requests.exceptions.ConnectionError)
+        client = Client(
+            base_url="http://localhost:3001",
+            retries=3,
+            backoff_factor=1.0,
+            max_backoff=1.5
+        )
+        
+        with pytest.raises(SecretError):
+            client.get_secret("test_token")
+        
+        assert self.mock_sleep.call_args_list == [call(1.0), call(1.5), call(1.5)]
 
 
-class TestExceptions(unittest.TestCase):
-    """Test cases for custom exceptions."""
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestHttpxTransport(unittest.TestCase):
+    """Test cases for the optional httpx (HTTP/2) transport."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.client = Client(base_url="http://localhost:3001", transport="httpx")
+        self.transport = FakeTransport()
+        self.patcher = patch.object(httpx.Client, "request", self.transport.request)
+        self.patcher.start()
+        self.addCleanup(self.patcher.stop)
+    
+    def test_uses_shared_httpx_client(self):
+        """Test that the httpx transport shares one HTTP/2 client."""
+        other = Client(base_url="http://localhost:3001", transport="httpx")
+        
+        assert isinstance(self.client._session, httpx.Client)
+        assert other._session is self.client._session
+    
+    def test_get_secret_success(self):
+        """Test secret retrieval over httpx."""
+        self.transport.response = fake_response({"value": "my_secret_value"})
+        
+        result = self.client.get_secret("test_token")
+        
+        assert result == "my_secret_value"
+        assert self.transport.calls == 1
+    
+    def test_proxy_sends_content(self):
+        """Test that proxy payloads are sent as raw content over httpx."""
+        self.transport.response = fake_response({"result": "success"})
+        
+        self.client.proxy("v1/test", "test_token", payload={"data": "test"})
+        
+        sent = json.loads(self.transport.kwargs["content"])
+        assert sent == {"data": "test"}
     
-    def test_exception_hierarchy(self):
-        """Test that all exceptions inherit from DoubleOError."""
-        self.assertTrue(issubclass(SecretError, oo.DoubleOError))
-        self.assertTrue(issubclass(ProxyError, oo.DoubleOError))
-        self.assertTrue(issubclass(AuthenticationError, oo.DoubleOError))
+    def test_transport_error_wrapped(self):
+        """Test that httpx transport errors raise SecretError."""
+        self.transport.error = httpx.ConnectError("connection refused")
+        
+        with pytest.raises(SecretError):
+            self.client.get_secret("test_token")
+
+
+def test_unknown_transport():
+    """Test that an unknown transport is rejected."""
+    with pytest.raises(ValueError):
+        Client(transport="carrier-pigeon")
+
+
+def test_httpx_transport_unavailable():
+    """Test that a missing httpx or h2 install is reported on construction."""
+    with patch("oo.client.httpx", None):
+        with pytest.raises(ImportError, match="http2"):
+            Client(transport="httpx")
 
 
-if __name__ == "__main__":
-    unittest.main()
+@pytest.mark.parametrize("exc", [SecretError, ProxyError, AuthenticationError])
+def test_exception_hierarchy(exc):
+    """Test that all exceptions inherit from DoubleOError."""
+    assert issubclass(exc, oo.DoubleOError)